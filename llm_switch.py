@@ -8,150 +8,306 @@ it to the right place. If nothing is found in usual spots, it offers to do a dee
 home folder. Also reads your local‑llm config and highlights the active model with a ⭐ star.
 """
 
+import functools
+import json
 import os
 import sys
 import shutil
+import stat
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-# Optional rich UI (beautiful tables, progress bars)
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-    from rich import print as rprint
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
-
-# Optional questionary (fancy interactive menus)
-try:
-    import questionary
-    HAS_QUESTIONARY = True
-except ImportError:
-    HAS_QUESTIONARY = False
+# Optional rich UI (beautiful tables, progress bars) and questionary
+# (fancy interactive menus). Both pull in heavy dependencies (pygments,
+# prompt_toolkit), so only probe for them here and import on first use.
+import importlib.util
+
+HAS_RICH = importlib.util.find_spec("rich") is not None
+HAS_QUESTIONARY = importlib.util.find_spec("questionary") is not None
+
+_ui_loaded = False
+
+def _load_ui() -> None:
+    """Import the optional UI packages on first use and publish their names
+    as module globals. No-op after the first call."""
+    global _ui_loaded, questionary, _rich_print
+    global Console, Table, Progress, SpinnerColumn, TextColumn, BarColumn
+    if _ui_loaded:
+        return
+    _ui_loaded = True
+    if HAS_RICH:
+        from rich.console import Console
+        from rich.table import Table
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+        from rich import print as _rich_print
+    if HAS_QUESTIONARY:
+        import questionary
+
+def rprint(*args, **kwargs):
+    """rich.print when rich is installed, plain print otherwise."""
+    if HAS_RICH:
+        _load_ui()
+        _rich_print(*args, **kwargs)
+    else:
+        print(*args, **kwargs)
 
 # ==================== CONFIG PARSING ====================
+@functools.lru_cache(maxsize=1)
 def get_active_model_name() -> Optional[str]:
-    """Reads ~/.config/local-llm/selected_model.conf and returns MODEL_NAME."""
-    config_path = Path.home() / ".config" / "local-llm" / "selected_model.conf"
-    if not config_path.exists():
-        return None
+    """Reads ~/.config/local-llm/selected_model.conf and returns MODEL_NAME.
+
+    Cached: several render stages ask for it, and the answer can't
+    change mid-run. Reads line by line and stops at the first hit
+    instead of materializing the whole file.
+    """
+    config_path = os.path.join(_HOME, ".config", "local-llm", "selected_model.conf")
     try:
-        for line in config_path.read_text().splitlines():
-            if line.startswith("MODEL_NAME="):
-                parts = line.split('"')
-                if len(parts) >= 2:
-                    return parts[1]
-    except Exception:
+        with open(config_path) as f:
+            for line in f:
+                if line.startswith("MODEL_NAME="):
+                    parts = line.split('"')
+                    if len(parts) >= 2:
+                        return parts[1]
+                    return None
+    except OSError:
+        pass
+    return None
+
+def get_active_model_dir() -> Optional[str]:
+    """Directory of the model named in selected_model.conf (MODEL_PATH), if set.
+
+    Most users keep all models next to the active one, so the scanner
+    treats this directory as the most likely place to look first.
+    """
+    config_path = os.path.join(_HOME, ".config", "local-llm", "selected_model.conf")
+    try:
+        with open(config_path) as f:
+            for line in f:
+                if line.startswith(("MODEL_PATH=", "MODEL_DIR=")):
+                    parts = line.split('"')
+                    if len(parts) >= 2 and parts[1]:
+                        value = parts[1]
+                        if line.startswith("MODEL_DIR="):
+                            return value
+                        return os.path.dirname(value)
+    except OSError:
         pass
     return None
 
 # ==================== ULTRA‑BROAD PATH SCANNER ====================
-def get_common_model_dirs() -> Dict[str, List[Path]]:
+# Resolved once: Path.home() re-reads HOME/pwd on every call, and
+# platform.system() shells out to uname machinery the first time.
+_HOME = os.path.expanduser("~")
+IS_WINDOWS = platform.system() == "Windows"
+
+# Model file extensions as an endswith() tuple: str.endswith with a
+# tuple is a single C-level check per name, cheaper than splitext or
+# lowercasing every filename. Windows filesystems are case-insensitive,
+# so the uppercase variants are matched there too.
+EXTENSIONS = (".gguf", ".bin", ".pt", ".pth", ".safetensors")
+EXT_TUPLE = EXTENSIONS + tuple(e.upper() for e in EXTENSIONS) if IS_WINDOWS else EXTENSIONS
+
+def _as_ext_tuple(exts) -> tuple:
+    """endswith() tuple for a backend's extension list."""
+    t = tuple(exts)
+    if t == EXTENSIONS:
+        return EXT_TUPLE
+    return t + tuple(e.upper() for e in t) if IS_WINDOWS else t
+
+# ==================== MODEL RECORDS ====================
+@dataclass(slots=True)
+class Model:
+    """One discovered model file.
+
+    A slotted dataclass rather than a dict: a scan can surface hundreds
+    of models, and per-instance slots drop the dict overhead (~400
+    bytes each) while turning every field access into a fixed-offset
+    load instead of a hashed key lookup.
+    """
+    name: str
+    path: str
+    backend: str
+    size: int
+    modified: float
+    dev: Optional[int] = None
+    ino: Optional[int] = None
+    # Display state stamped lazily by the renderers.
+    active: bool = False
+    size_str: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for the on-disk index cache."""
+        return {
+            "name": self.name,
+            "path": self.path,
+            "backend": self.backend,
+            "size": self.size,
+            "modified": self.modified,
+            "dev": self.dev,
+            "ino": self.ino,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Model":
+        return cls(
+            name=d["name"],
+            path=d["path"],
+            backend=d["backend"],
+            size=d["size"],
+            modified=d["modified"],
+            dev=d.get("dev"),
+            ino=d.get("ino"),
+        )
+
+@functools.lru_cache(maxsize=1)
+def get_common_model_dirs() -> Dict[str, List[str]]:
     """
     Returns a dict of backend name -> list of directories to scan.
     Covers all common places on Windows and Linux, including your custom
-    ~/.local/share/llm-models.
+    ~/.local/share/llm-models. Paths are plain strings.
     """
-    home = Path.home()
+    home = _HOME
+    join = os.path.join
     paths = {}
 
     # ----- llama.cpp -----
     llama_paths = [
-        home / "models",
-        home / "llama.cpp" / "models",
-        home / "llama" / "models",
-        home / ".llama" / "models",
-        Path.cwd() / "models",
+        join(home, "models"),
+        join(home, "llama.cpp", "models"),
+        join(home, "llama", "models"),
+        join(home, ".llama", "models"),
+        join(os.getcwd(), "models"),
     ]
-    if platform.system() == "Windows":
-        user_profile = Path(os.environ.get("USERPROFILE", ""))
+    if IS_WINDOWS:
+        user_profile = os.environ.get("USERPROFILE")
         if user_profile:
             llama_paths.extend([
-                user_profile / "models",
-                user_profile / "llama.cpp" / "models",
+                join(user_profile, "models"),
+                join(user_profile, "llama.cpp", "models"),
             ])
     else:  # Linux/macOS
         llama_paths.extend([
-            Path("/usr/local/share/llama.cpp/models"),
-            Path("/opt/llama.cpp/models"),
+            "/usr/local/share/llama.cpp/models",
+            "/opt/llama.cpp/models",
         ])
     paths["llama.cpp"] = list(dict.fromkeys(llama_paths))
 
     # ----- LM Studio -----
     lmstudio_paths = []
-    if platform.system() == "Windows":
-        user_profile = Path(os.environ.get("USERPROFILE", ""))
+    if IS_WINDOWS:
+        user_profile = os.environ.get("USERPROFILE")
         if user_profile:
-            lmstudio_paths.append(user_profile / ".lmstudio" / "models")
-        localappdata = Path(os.environ.get("LOCALAPPDATA", ""))
-        if localappdata.exists():
-            lmstudio_paths.append(localappdata / "LM Studio" / "models")
+            lmstudio_paths.append(join(user_profile, ".lmstudio", "models"))
+        localappdata = os.environ.get("LOCALAPPDATA")
+        if localappdata:
+            lmstudio_paths.append(join(localappdata, "LM Studio", "models"))
     else:
-        lmstudio_paths.append(home / ".lmstudio" / "models")
-        lmstudio_paths.append(home / "Library/Application Support/LM Studio/models")  # macOS
+        lmstudio_paths.append(join(home, ".lmstudio", "models"))
+        lmstudio_paths.append(join(home, "Library/Application Support/LM Studio/models"))  # macOS
     paths["LM Studio"] = lmstudio_paths
 
     # ----- Jan.ai -----
     jan_paths = []
-    if platform.system() == "Windows":
-        user_profile = Path(os.environ.get("USERPROFILE", ""))
+    if IS_WINDOWS:
+        user_profile = os.environ.get("USERPROFILE")
         if user_profile:
-            jan_paths.append(user_profile / "jan" / "models")
-        localappdata = Path(os.environ.get("LOCALAPPDATA", ""))
-        if localappdata.exists():
-            jan_paths.append(localappdata / "jan" / "models")
+            jan_paths.append(join(user_profile, "jan", "models"))
+        localappdata = os.environ.get("LOCALAPPDATA")
+        if localappdata:
+            jan_paths.append(join(localappdata, "jan", "models"))
     else:
-        jan_paths.append(home / "jan" / "models")
-        jan_paths.append(home / ".jan" / "models")
+        jan_paths.append(join(home, "jan", "models"))
+        jan_paths.append(join(home, ".jan", "models"))
     paths["Jan.ai"] = jan_paths
 
     # ----- Oobabooga (Text Generation WebUI) -----
     ooba_paths = [
-        home / "oobabooga" / "models",
-        home / "text-generation-webui" / "models",
+        join(home, "oobabooga", "models"),
+        join(home, "text-generation-webui", "models"),
     ]
-    if platform.system() == "Windows":
-        user_profile = Path(os.environ.get("USERPROFILE", ""))
+    if IS_WINDOWS:
+        user_profile = os.environ.get("USERPROFILE")
         if user_profile:
-            ooba_paths.append(user_profile / "oobabooga" / "models")
+            ooba_paths.append(join(user_profile, "oobabooga", "models"))
     paths["Oobabooga"] = ooba_paths
 
     # ----- General / catch‑all (including your custom path) -----
     general_paths = [
-        home / "Downloads",
-        home / "Documents" / "models",
-        home / ".local/share/llm-models",      # your custom directory
-        Path("/models"),
+        join(home, "Downloads"),
+        join(home, "Documents", "models"),
+        join(home, ".local/share/llm-models"),      # your custom directory
+        "/models",
     ]
-    if platform.system() == "Windows":
-        general_paths.append(Path("C:/models"))
+    if IS_WINDOWS:
+        general_paths.append("C:/models")
     paths["Other locations"] = general_paths
 
     return paths
 
-# Build the BACKENDS dict with file extensions
-COMMON_BACKENDS = {}
-for name, dirs in get_common_model_dirs().items():
-    COMMON_BACKENDS[name] = {
-        "paths": dirs,
-        "extensions": [".gguf", ".bin", ".pt", ".pth", ".safetensors"],
-    }
+# Build the BACKENDS dict with file extensions. Paths are kept as plain
+# strings during discovery; only the model the user finally picks gets
+# promoted to a Path object. Built lazily so importing the module stays
+# flat; the cached dict is shared, so user-added folders stick.
+@functools.lru_cache(maxsize=1)
+def get_backends() -> Dict[str, Dict[str, Any]]:
+    backends = {}
+    for name, dirs in get_common_model_dirs().items():
+        backends[name] = {
+            "paths": list(dirs),
+            "extensions": EXTENSIONS,
+        }
+    return backends
 
 # We'll also optionally add a "Deep scan" backend later if user chooses.
 
 # ==================== DEEP SCAN ====================
-def deep_scan_models() -> List[Dict[str, Any]]:
+def _deep_scan_fwalk(root: str, ext_tuple) -> List[Model]:
+    """Deep scan via os.fwalk: each stat resolves relative to the open
+    directory fd, so the kernel skips re-walking the full pathname for
+    every file - a real win on deep trees."""
+    models = []
+    append = models.append
+    base_depth = root.rstrip(os.sep).count(os.sep)
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(root, follow_symlinks=False):
+        depth = dirpath.count(os.sep) - base_depth
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in _PRUNE_DIRS and (depth < 3 or not d.startswith("."))
+        ]
+        for fn in filenames:
+            if fn.endswith(ext_tuple):
+                try:
+                    st = os.stat(fn, dir_fd=dirfd, follow_symlinks=False)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                append(Model(
+                    name=fn,
+                    path=os.path.join(dirpath, fn),
+                    backend="Deep scan",
+                    size=st.st_size,
+                    modified=st.st_mtime,
+                    dev=st.st_dev,
+                    ino=st.st_ino,
+                ))
+    return models
+
+def _deep_scan() -> List[Model]:
+    if hasattr(os, "fwalk"):  # POSIX; not available on Windows
+        return _deep_scan_fwalk(_HOME, EXT_TUPLE)
+    return _scan_one("Deep scan", _HOME, EXT_TUPLE, allow_hidden_depth=3)
+
+def deep_scan_models() -> List[Model]:
     """
     Recursively scan the user's home directory for model files.
     Warning: this can be slow on large disks.
     """
-    home = Path.home()
-    models = []
-    extensions = [".gguf", ".bin", ".pt", ".pth", ".safetensors"]
+    _load_ui()
     console = Console() if HAS_RICH else None
 
     if console:
@@ -161,84 +317,226 @@ def deep_scan_models() -> List[Dict[str, Any]]:
             transient=False,
         ) as progress:
             task = progress.add_task("Deep scanning your home folder...", total=None)
-            for ext in extensions:
-                for model_path in home.rglob(f"*{ext}"):
-                    if model_path.is_file():
-                        stat = model_path.stat()
-                        models.append({
-                            "name": model_path.name,
-                            "path": str(model_path.absolute()),
-                            "backend": "Deep scan",
-                            "size": stat.st_size,
-                            "modified": stat.st_mtime,
-                        })
+            models = _deep_scan()
             progress.update(task, completed=True)
     else:
         print("Deep scanning your home folder... (this may take a while)")
-        for ext in extensions:
-            for model_path in home.rglob(f"*{ext}"):
-                if model_path.is_file():
-                    stat = model_path.stat()
-                    models.append({
-                        "name": model_path.name,
-                        "path": str(model_path.absolute()),
-                        "backend": "Deep scan",
-                        "size": stat.st_size,
-                        "modified": stat.st_mtime,
-                    })
+        models = _deep_scan()
     return models
 
 # ==================== MODEL DISCOVERY (COMMON PATHS) ====================
-def discover_models_common() -> List[Dict[str, Any]]:
-    """Walk through common directories and collect model files."""
-    models = []
-    console = Console() if HAS_RICH else None
+# Subdirectories never worth descending into: VCS/dev/cache noise plus
+# HuggingFace-hub internals (the hub's blobs/ holds extensionless files
+# and snapshots/ only symlinks back to them).
+_PRUNE_DIRS = frozenset({
+    "__pycache__", "node_modules", "venv", "snap",
+    ".git", ".svn", ".cache", ".venv", ".mozilla", ".Trash",
+    "blobs", "refs", "snapshots",
+})
+
+def _scandir_walk(path, allow_hidden_depth=0):
+    """Yield os.DirEntry objects for everything under `path`.
+
+    Uses a single os.scandir() pass so each entry's type and stat info come
+    from the cached DirEntry instead of extra stat() syscalls. Blocklisted
+    directories are always pruned; other hidden directories are entered
+    only within the first `allow_hidden_depth` levels (the deep scan uses
+    this to still reach ~/.lmstudio or ~/.local/share/llm-models).
+    Iterates with an explicit stack: no Python frame per directory and no
+    RecursionError on pathologically deep trees.
+    """
+    stack = [(path, allow_hidden_depth)]
+    while stack:
+        current, hidden_depth = stack.pop()
+        try:
+            it = os.scandir(current)
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in _PRUNE_DIRS:
+                            continue
+                        if entry.name.startswith(".") and hidden_depth <= 0:
+                            continue
+                        stack.append((entry.path, hidden_depth - 1))
+                    else:
+                        yield entry
+                except OSError:
+                    continue
 
-    if console:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-        ) as progress:
-            task = progress.add_task("Scanning common places for models...", total=None)
-            for backend_name, config in COMMON_BACKENDS.items():
-                for directory in config["paths"]:
-                    if not directory.exists():
-                        continue
-                    for ext in config["extensions"]:
-                        for model_path in directory.rglob(f"*{ext}"):
-                            if model_path.is_file():
-                                stat = model_path.stat()
-                                models.append({
-                                    "name": model_path.name,
-                                    "path": str(model_path.absolute()),
-                                    "backend": backend_name,
-                                    "size": stat.st_size,
-                                    "modified": stat.st_mtime,
-                                })
-            progress.update(task, completed=True)
-    else:
-        print("Scanning common places for models...")
-        for backend_name, config in COMMON_BACKENDS.items():
-            for directory in config["paths"]:
-                if not directory.exists():
+# ==================== DISCOVERY CACHE ====================
+CACHE_FILE = Path.home() / ".cache" / "llm_switch" / "index.json"
+
+def _load_index_cache() -> Dict[str, Any]:
+    """Load the persisted model index; returns {} if missing or unreadable."""
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except Exception:
+        return {}
+
+def _save_index_cache(cache: Dict[str, Any]) -> None:
+    """Atomically persist the model index (best effort)."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, CACHE_FILE)
+    except Exception:
+        pass
+
+def _scan_one(backend_name, directory, ext_tuple, allow_hidden_depth=0) -> List[Model]:
+    """Scan a single directory tree and return the models found in it."""
+    found = []
+    append = found.append  # avoid the attribute lookup per hit
+    for entry in _scandir_walk(directory, allow_hidden_depth):
+        if entry.name.endswith(ext_tuple) and entry.is_file(follow_symlinks=False):
+            st = entry.stat()
+            append(Model(
+                name=entry.name,
+                path=entry.path,
+                backend=backend_name,
+                size=st.st_size,
+                modified=st.st_mtime,
+                dev=st.st_dev,
+                ino=st.st_ino,
+            ))
+    return found
+
+# Roots already proven absent this run. Most users have one or two
+# backends installed, so the bulk of the configured paths fail the stat
+# every time; when main() rescans after a custom-path prompt there is no
+# point re-statting them.
+_missing_dirs: set = set()
+
+def discover_models_common(use_cache: bool = True,
+                           backends: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Model]:
+    """Walk through common directories and collect model files.
+
+    Directory walks are I/O-bound, so each root is scanned in its own
+    worker thread and the results merged as they complete. Results are
+    cached in ~/.cache/llm_switch/index.json keyed by each root's
+    mtime, so unchanged roots skip the walk entirely on warm runs.
+    `backends` restricts the scan to a subset of the configured
+    backends; main() uses it to rescan only freshly added folders.
+    """
+    models = []
+    tasks = []
+    cache = _load_index_cache() if use_cache else {}
+    # A full scan rebuilds the index from scratch (dropping roots that
+    # vanished); a partial scan only overlays its own roots so the
+    # entries for everything it skipped survive.
+    new_cache: Dict[str, Any] = dict(cache) if backends is not None else {}
+
+    # The same physical file can surface twice (hardlinks, roots that
+    # slipped past dedup via bind mounts); key on (device, inode), which
+    # the walker already fetched, and keep the first-seen entry.
+    seen_inodes = set()
+
+    def _merge(found):
+        for m in found:
+            if m.dev is not None:
+                key = (m.dev, m.ino)
+                if key in seen_inodes:
                     continue
-                for ext in config["extensions"]:
-                    for model_path in directory.rglob(f"*{ext}"):
-                        if model_path.is_file():
-                            stat = model_path.stat()
-                            models.append({
-                                "name": model_path.name,
-                                "path": str(model_path.absolute()),
-                                "backend": backend_name,
-                                "size": stat.st_size,
-                                "modified": stat.st_mtime,
-                            })
+                seen_inodes.add(key)
+            models.append(m)
+
+    # Collect existing roots and drop any that nest inside another (via
+    # symlinks or overlapping config) so no subtree is walked twice.
+    candidates = []
+    if backends is None:
+        backends = get_backends()
+    for backend_name, config in backends.items():
+        ext_tuple = _as_ext_tuple(config["extensions"])
+        for directory in config["paths"]:
+            if directory in _missing_dirs:
+                continue
+            # One stat doubles as existence check and cache key; a
+            # separate exists() would stat the same path twice.
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                _missing_dirs.add(directory)
+                continue
+            candidates.append((os.path.realpath(directory), backend_name, directory, ext_tuple, mtime_ns))
+    candidates.sort(key=lambda c: len(c[0]))
+    kept_real: List[str] = []
+    for real, backend_name, directory, ext_tuple, mtime_ns in candidates:
+        if any(real == r or real.startswith(r + os.sep) for r in kept_real):
+            continue
+        kept_real.append(real)
+        root_key = directory
+        cached = cache.get(root_key)
+        if cached and cached.get("mtime_ns") == mtime_ns:
+            _merge(Model.from_dict(d) for d in cached["models"])
+            new_cache[root_key] = cached
+            continue
+        tasks.append((backend_name, directory, ext_tuple, root_key, mtime_ns))
+
+    # Scan the root holding the currently-active model first: in the
+    # common case the user picks a sibling of it, and the sort below
+    # floats those entries to the top of the list.
+    likely = get_active_model_dir()
+    if likely:
+        tasks.sort(key=lambda t: 0 if likely == t[1] or likely.startswith(t[1] + os.sep) else 1)
+    def _float_likely_first():
+        if likely:
+            likely_prefix = likely + os.sep
+            models.sort(key=lambda m: 0 if m.path.startswith(likely_prefix) else 1)
+
+    if not tasks:
+        if use_cache:
+            _save_index_cache(new_cache)
+        _float_likely_first()
+        return models
+
+    # One merge loop for both UIs; only the progress reporting differs.
+    # Results stream in per finished root, so the progress line can show
+    # a live count instead of staying silent until the end.
+    def _collect(progress=None, progress_task=None):
+        for future in as_completed(futures):
+            found = future.result()
+            root_key, mtime_ns = futures[future]
+            new_cache[root_key] = {"mtime_ns": mtime_ns, "models": [m.to_dict() for m in found]}
+            _merge(found)
+            if progress is not None:
+                progress.update(
+                    progress_task, advance=1,
+                    description=f"Scanning common places for models... {len(models)} found",
+                )
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        futures = {
+            executor.submit(_scan_one, backend_name, directory, ext_tuple): (root_key, mtime_ns)
+            for backend_name, directory, ext_tuple, root_key, mtime_ns in tasks
+        }
+        # Submit first, set up the UI second: rich's first import and
+        # terminal probing cost tens of milliseconds that the scan
+        # threads can overlap with real I/O.
+        _load_ui()
+        console = Console() if HAS_RICH else None
+        if console:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                transient=True,
+            ) as progress:
+                task = progress.add_task("Scanning common places for models...", total=len(futures))
+                _collect(progress, task)
+        else:
+            print("Scanning common places for models...")
+            _collect()
+    if use_cache:
+        _save_index_cache(new_cache)
+    _float_likely_first()
     return models
 
 # ==================== HELP WHEN NOTHING FOUND ====================
 def ask_for_deep_scan() -> bool:
     """Offer to do a deep scan if initial scan found nothing."""
+    _load_ui()
     rprint("\n[bold yellow]No models found in common places.[/bold yellow]")
     if HAS_QUESTIONARY:
         return questionary.confirm("Do you want to do a deep scan of your entire home folder? (may be slow)").ask()
@@ -248,6 +546,7 @@ def ask_for_deep_scan() -> bool:
 
 def ask_for_custom_paths() -> bool:
     """Let user manually add a folder."""
+    _load_ui()
     rprint("\n[bold yellow]No models found even after deep scan.[/bold yellow]")
 
     if HAS_QUESTIONARY:
@@ -260,9 +559,12 @@ def ask_for_custom_paths() -> bool:
                 break
             path = Path(path_str).expanduser().resolve()
             if path.exists() and path.is_dir():
-                if "User added" not in COMMON_BACKENDS:
-                    COMMON_BACKENDS["User added"] = {"paths": [], "extensions": [".gguf", ".bin", ".pt", ".pth", ".safetensors"]}
-                COMMON_BACKENDS["User added"]["paths"].append(path)
+                backends = get_backends()
+                if "User added" not in backends:
+                    backends["User added"] = {"paths": [], "extensions": EXTENSIONS}
+                backends["User added"]["paths"].append(os.fspath(path))
+                _missing_dirs.discard(os.fspath(path))
+                _invalidate_backend_cache()
                 rprint(f"[green]Added {path}[/green]")
             else:
                 rprint("[red]That folder does not exist. Try again.[/red]")
@@ -275,19 +577,55 @@ def ask_for_custom_paths() -> bool:
                 break
             path = Path(path_str).expanduser().resolve()
             if path.exists() and path.is_dir():
-                if "User added" not in COMMON_BACKENDS:
-                    COMMON_BACKENDS["User added"] = {"paths": [], "extensions": [".gguf", ".bin", ".pt", ".pth", ".safetensors"]}
-                COMMON_BACKENDS["User added"]["paths"].append(path)
+                backends = get_backends()
+                if "User added" not in backends:
+                    backends["User added"] = {"paths": [], "extensions": EXTENSIONS}
+                backends["User added"]["paths"].append(os.fspath(path))
+                _missing_dirs.discard(os.fspath(path))
+                _invalidate_backend_cache()
                 print(f"Added {path}")
             else:
                 print("Invalid path, try again.")
         return True
 
 # ==================== SELECTION INTERFACE ====================
-def show_models_table(models: List[Dict[str, Any]], active_name: Optional[str] = None) -> None:
-    """Display a rich table of discovered models, marking the active one with a star."""
+# Backend names with at least one configured path, computed lazily and
+# invalidated when the user adds folders.
+_valid_backends_cache: Optional[List[str]] = None
+
+def _valid_backends() -> List[str]:
+    global _valid_backends_cache
+    if _valid_backends_cache is None:
+        _valid_backends_cache = [n for n, c in get_backends().items() if c["paths"]]
+    return _valid_backends_cache
+
+def _invalidate_backend_cache() -> None:
+    global _valid_backends_cache
+    _valid_backends_cache = None
+
+def _mark_active(models: List[Model], active_name: Optional[str]) -> None:
+    """Stamp each model once with whether it is the configured active model,
+    so the renderers branch on a stored flag instead of re-comparing names."""
+    for m in models:
+        m.active = bool(active_name) and m.name == active_name
+
+def _size_str(m: Model) -> str:
+    """Human-readable size for a model dict, formatted once and cached."""
+    if not m.size_str:
+        m.size_str = f"{m.size / 1048576:.1f} MB"
+    return m.size_str
+
+def show_models_table(models: List[Model], active_name: Optional[str] = None,
+                      limit: int = 200) -> None:
+    """Display a rich table of discovered models, marking the active one with a star.
+
+    Shows at most `limit` rows (the most recently modified first when
+    truncating) so huge model stores don't stall the renderer.
+    """
     if not HAS_RICH:
         return
+    _load_ui()
+    _mark_active(models, active_name)
     console = Console()
     table = Table(title="Discovered Models", show_lines=True)
     table.add_column(" ", style="bold yellow", width=2)  # star column
@@ -296,22 +634,30 @@ def show_models_table(models: List[Dict[str, Any]], active_name: Optional[str] =
     table.add_column("Model Name", style="green")
     table.add_column("Size", justify="right", style="yellow")
 
+    hidden = 0
+    if len(models) > limit:
+        hidden = len(models) - limit
+        models = sorted(models, key=lambda m: m.modified, reverse=True)[:limit]
+
     for idx, m in enumerate(models, 1):
-        star = "⭐" if active_name and m["name"] == active_name else ""
-        size_mb = m["size"] / (1024 * 1024)
+        star = "⭐" if m.active else ""
         table.add_row(
             star,
             str(idx),
-            m["backend"],
-            m["name"],
-            f"{size_mb:.1f} MB"
+            m.backend,
+            m.name,
+            _size_str(m)
         )
+    if hidden:
+        table.add_row("", "", "", f"... +{hidden} more (older)", "")
     console.print(table)
 
-def select_model_interactive(models: List[Dict[str, Any]], active_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+def select_model_interactive(models: List[Model], active_name: Optional[str] = None) -> Optional[Model]:
     """Let user pick a model, with the active one highlighted."""
     if not models:
         return None
+    _load_ui()
+    _mark_active(models, active_name)
 
     if HAS_RICH:
         show_models_table(models, active_name)
@@ -319,9 +665,8 @@ def select_model_interactive(models: List[Dict[str, Any]], active_name: Optional
     if HAS_QUESTIONARY:
         choices = []
         for m in models:
-            size_mb = m["size"] / (1024 * 1024)
-            prefix = "⭐ " if active_name and m["name"] == active_name else "   "
-            label = f"{prefix}[{m['backend']}] {m['name']} ({size_mb:.1f} MB)"
+            prefix = "⭐ " if m.active else "   "
+            label = f"{prefix}[{m.backend}] {m.name} ({_size_str(m)})"
             choices.append(questionary.Choice(title=label, value=m))
         answer = questionary.select(
             "Select a model:",
@@ -334,9 +679,8 @@ def select_model_interactive(models: List[Dict[str, Any]], active_name: Optional
         # Fallback with simple numbered list
         print("\nAvailable models:")
         for i, m in enumerate(models, 1):
-            size_mb = m["size"] / (1024 * 1024)
-            star = " ⭐" if active_name and m["name"] == active_name else ""
-            print(f"{i:3}. [{m['backend']}] {m['name']} ({size_mb:.1f} MB){star}")
+            star = " ⭐" if m.active else ""
+            print(f"{i:3}. [{m.backend}] {m.name} ({_size_str(m)}){star}")
         print("0. Cancel")
         try:
             choice = int(input("\nEnter number: "))
@@ -348,9 +692,9 @@ def select_model_interactive(models: List[Dict[str, Any]], active_name: Optional
 
 def select_destination_backend(source_backend: str) -> Optional[str]:
     """Let user pick a destination backend (excluding source)."""
-    # Combine COMMON_BACKENDS with any user-added backends
-    all_backends = COMMON_BACKENDS.copy()
-    dest_backends = [name for name in all_backends if name != source_backend and all_backends[name]["paths"]]
+    _load_ui()
+    # Configured backends plus any user-added ones, minus the source
+    dest_backends = [name for name in _valid_backends() if name != source_backend]
     if not dest_backends:
         rprint("[red]No other backends with valid paths configured.[/red]")
         return None
@@ -376,21 +720,140 @@ def select_destination_backend(source_backend: str) -> Optional[str]:
         return None
 
 # ==================== SWITCHING LOGIC ====================
-def switch_model(model: Dict[str, Any], dest_backend: str, method: str = "copy") -> bool:
+# 8 MiB per copy request: large enough to amortize syscall overhead,
+# small enough to keep the progress bar responsive.
+_COPY_CHUNK = 8 << 20
+
+# FICLONE ioctl: O(1) copy-on-write clone on Btrfs/XFS.
+_FICLONE = 0x40049409
+
+def _fast_copy(src, dst, on_progress=None) -> str:
+    """Copy src to dst keeping the data in kernel space where possible.
+
+    Tries a FICLONE reflink (instant CoW clone on Btrfs/XFS), then
+    os.copy_file_range, then os.sendfile, then a plain buffered
+    read/write loop (the only option on Windows). Copies metadata
+    afterwards to match shutil.copy2. `on_progress`, if given, is
+    called with the byte count of each chunk. Returns the name of the
+    mechanism that did the work.
+    """
+    mechanism = "buffered copy"
+    in_fd = os.open(src, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # Tell the kernel we read front-to-back so it readaheads
+        # aggressively and drops pages behind us.
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            remaining = os.fstat(in_fd).st_size
+            if remaining and sys.platform == "linux":
+                try:
+                    import fcntl
+                    fcntl.ioctl(out_fd, _FICLONE, in_fd)
+                    if on_progress:
+                        on_progress(remaining)
+                    remaining = 0
+                    mechanism = "reflink"
+                except OSError:
+                    # EOPNOTSUPP/EXDEV etc.: not a CoW filesystem.
+                    pass
+            if remaining and hasattr(os, "copy_file_range"):
+                try:
+                    while remaining > 0:
+                        sent = os.copy_file_range(in_fd, out_fd, min(remaining, _COPY_CHUNK))
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                        if on_progress:
+                            on_progress(sent)
+                    if remaining == 0:
+                        mechanism = "copy_file_range"
+                except OSError:
+                    pass
+            if remaining and hasattr(os, "sendfile"):
+                try:
+                    while remaining > 0:
+                        sent = os.sendfile(out_fd, in_fd, None, min(remaining, _COPY_CHUNK))
+                        if sent == 0:
+                            break
+                        remaining -= sent
+                        if on_progress:
+                            on_progress(sent)
+                    if remaining == 0:
+                        mechanism = "sendfile"
+                except OSError:
+                    pass
+            while remaining > 0:
+                buf = os.read(in_fd, 4 * 1024 * 1024)
+                if not buf:
+                    break
+                view = memoryview(buf)
+                while view:
+                    written = os.write(out_fd, view)
+                    view = view[written:]
+                    remaining -= written
+                    if on_progress:
+                        on_progress(written)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    shutil.copystat(src, dst)
+    return mechanism
+
+def _try_reflink(src, dst) -> bool:
+    """Attempt an O(1) copy-on-write clone of src at dst.
+
+    Returns True on success. On failure the half-created destination is
+    removed so the caller can fall back to a normal copy.
+    """
+    if sys.platform != "linux":
+        return False
+    import fcntl
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            fcntl.ioctl(out_fd, _FICLONE, in_fd)
+        except OSError:
+            # EOPNOTSUPP/EXDEV: not a CoW filesystem or crossing devices.
+            os.close(out_fd)
+            try:
+                os.unlink(dst)
+            except OSError:
+                pass
+            return False
+        os.close(out_fd)
+    finally:
+        os.close(in_fd)
+    shutil.copystat(src, dst)
+    return True
+
+def switch_model(model: Model, dest_backend: str, method: str = "copy") -> bool:
     """Copy or symlink model to destination backend's first path."""
-    src_path = Path(model["path"])
-    dest_dir = COMMON_BACKENDS[dest_backend]["paths"][0]
-    dest_path = dest_dir / src_path.name
+    _load_ui()
+    src_path = model.path
+    dest_dir = get_backends()[dest_backend]["paths"][0]
+    dest_path = os.path.join(dest_dir, model.name)
 
     # Create destination directory if needed
     try:
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(dest_dir, exist_ok=True)
     except Exception as e:
         rprint(f"[red]Error creating destination directory: {e}[/red]")
         return False
 
-    # Handle existing file
-    if dest_path.exists():
+    # Handle existing file. lstat doesn't follow symlinks, so broken
+    # links at the destination are detected too (exists() misses them).
+    try:
+        dest_st = os.lstat(dest_path)
+    except FileNotFoundError:
+        dest_st = None
+    if dest_st is not None:
         if HAS_QUESTIONARY:
             overwrite = questionary.confirm(
                 f"File {dest_path} already exists. Overwrite?",
@@ -403,9 +866,10 @@ def switch_model(model: Dict[str, Any], dest_backend: str, method: str = "copy")
             rprint("[yellow]Skipping.[/yellow]")
             return False
         try:
-            if dest_path.is_symlink() or dest_path.is_file():
-                dest_path.unlink()
-            elif dest_path.is_dir():
+            mode = dest_st.st_mode
+            if stat.S_ISLNK(mode) or stat.S_ISREG(mode):
+                os.unlink(dest_path)
+            elif stat.S_ISDIR(mode):
                 shutil.rmtree(dest_path)
         except Exception as e:
             rprint(f"[red]Could not remove existing file: {e}[/red]")
@@ -413,31 +877,56 @@ def switch_model(model: Dict[str, Any], dest_backend: str, method: str = "copy")
 
     # Perform switch
     try:
+        # A reflink shares the data blocks until either side is written,
+        # so cloning a 40 GB model is instant and costs no space. The
+        # copy path tries it opportunistically too; the explicit method
+        # exists so the user learns when their filesystem cannot clone.
+        if method == "reflink":
+            if _try_reflink(src_path, dest_path):
+                rprint(f"[green]Reflinked (CoW clone): {dest_path}[/green]")
+                return True
+            rprint("[yellow]Reflink not supported here (needs Btrfs/XFS). Falling back to copy.[/yellow]")
+            method = "copy"
+        # On the same filesystem a hardlink is instant, takes no extra
+        # space, and needs no special rights on Windows - try it first
+        # for both link methods.
+        if method in ("symlink", "hardlink"):
+            try:
+                if os.stat(src_path).st_dev == os.stat(dest_dir).st_dev:
+                    os.link(src_path, dest_path)
+                    rprint(f"[green]Hard link created: {dest_path}[/green]")
+                    return True
+            except OSError:
+                pass
+            if method == "hardlink":
+                rprint("[yellow]Hard link not possible (different filesystem?). Falling back to copy.[/yellow]")
+                method = "copy"
         if method == "symlink":
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 try:
                     os.symlink(src_path, dest_path)
                     rprint(f"[green]Symbolic link created: {dest_path}[/green]")
                 except OSError:
                     rprint("[yellow]Symlink failed (maybe need admin/developer mode). Falling back to copy.[/yellow]")
-                    shutil.copy2(src_path, dest_path)
+                    _fast_copy(src_path, dest_path)
                     rprint(f"[green]Copied to {dest_path}[/green]")
             else:
                 os.symlink(src_path, dest_path)
                 rprint(f"[green]Symbolic link created: {dest_path}[/green]")
         else:
             if HAS_RICH:
+                size = os.stat(src_path).st_size
                 with Progress(
                     TextColumn("[progress.description]{task.description}"),
                     BarColumn(),
                     TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 ) as progress:
-                    task = progress.add_task("[cyan]Copying...", total=src_path.stat().st_size)
-                    shutil.copy2(src_path, dest_path)
-                    progress.update(task, completed=src_path.stat().st_size)
+                    task = progress.add_task("[cyan]Copying...", total=size)
+                    mechanism = _fast_copy(src_path, dest_path,
+                                           on_progress=lambda n: progress.update(task, advance=n))
             else:
-                shutil.copy2(src_path, dest_path)
-            rprint(f"[green]Copied to {dest_path}[/green]")
+                mechanism = _fast_copy(src_path, dest_path)
+            rprint(f"[green]Copied to {dest_path} (via {mechanism})[/green]")
         return True
     except Exception as e:
         rprint(f"[red]Error during switch: {e}[/red]")
@@ -445,6 +934,9 @@ def switch_model(model: Dict[str, Any], dest_backend: str, method: str = "copy")
 
 # ==================== MAIN ====================
 def main():
+    use_cache = "--no-cache" not in sys.argv
+    _load_ui()
+
     # Minimal intro
     if HAS_RICH:
         console = Console()
@@ -457,16 +949,23 @@ def main():
         console.print(f"Active model from config: [bold yellow]⭐ {active_name}[/bold yellow]")
 
     # Discover models in common places
-    models = discover_models_common()
+    models = discover_models_common(use_cache=use_cache)
 
     # If none, offer deep scan
     if not models:
         if ask_for_deep_scan():
             models = deep_scan_models()
         if not models:
-            # Still none? ask for manual folder
+            # Still none? ask for manual folder. Every other root was
+            # already scanned (or proven missing) on the first pass, so
+            # only the freshly added folders need walking.
             if ask_for_custom_paths():
-                models = discover_models_common()  # rescan with user-added paths
+                user_added = get_backends().get("User added")
+                if user_added:
+                    models = discover_models_common(
+                        use_cache=use_cache,
+                        backends={"User added": user_added},
+                    )
             if not models:
                 rprint("[red]No models found. Exiting.[/red]")
                 sys.exit(1)
@@ -478,7 +977,7 @@ def main():
         sys.exit(0)
 
     # Select destination backend
-    dest_backend = select_destination_backend(selected["backend"])
+    dest_backend = select_destination_backend(selected.backend)
     if dest_backend is None:
         rprint("[yellow]No destination selected. Exiting.[/yellow]")
         sys.exit(0)
@@ -490,6 +989,8 @@ def main():
             "How to switch?",
             choices=[
                 questionary.Choice("Copy (safe, uses disk space)", value="copy"),
+                questionary.Choice("Reflink (instant CoW clone, Btrfs/XFS only)", value="reflink"),
+                questionary.Choice("Hardlink (no extra space, same filesystem only)", value="hardlink"),
                 questionary.Choice("Symlink (saves space, may need admin)", value="symlink"),
             ],
             default="copy"
@@ -497,8 +998,12 @@ def main():
         if method is None:
             method = "copy"
     else:
-        choice = input("Copy or symlink? (c/s) [c]: ").strip().lower()
-        if choice == 's':
+        choice = input("Copy, reflink, hardlink or symlink? (c/r/h/s) [c]: ").strip().lower()
+        if choice == 'r':
+            method = "reflink"
+        elif choice == 'h':
+            method = "hardlink"
+        elif choice == 's':
             method = "symlink"
 
     # Do it